@@ -4,10 +4,24 @@ from __future__ import annotations
 
 import argparse
 import json
+import sys
+import textwrap
 from typing import Any, Dict
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None
+
 from mortgage_oop.mortgage_calculator import MortgageCalculator
 
+# Static schedule-table strings, built once at import time.
+_HEADER = "#".ljust(4) + "Interest".rjust(12) + "Principal".rjust(12) + "Balance".rjust(14)
+_SEP = "-" * 44
+
+# Precompiled %-template for schedule rows: C-level formatting, parsed once.
+_ROW_TEMPLATE = "%-4d%12.2f%12.2f%14.2f"
+
 
 def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
@@ -47,20 +61,9 @@ def build_parser() -> argparse.ArgumentParser:
     return parser
 
 
-def format_summary(summary: Dict[str, Any]) -> str:
-    if summary:
-        lines = [
-            "Mortgage Summary:",
-            f"  Principal:        {summary['principal']}",
-            f"  Annual Rate (%):  {summary['annual_rate']}",
-            f"  Years:            {summary['years']}",
-            f"  Payments/Year:    {summary['payments_per_year']}",
-            f"  Payment Amount:   {summary['payment_amount']}",
-            f"  Total Cost:       {summary['total_cost']}",
-            f"  Total Interest:   {summary['total_interest']}",
-        ]
-        return "\n".join(lines)
-    return ""
+def format_summary(calculator: MortgageCalculator) -> str:
+    body = textwrap.indent(calculator.summary_text, "  ")
+    return f"Mortgage Summary:\n{body}"
 
 
 def main() -> None:
@@ -87,29 +90,23 @@ def main() -> None:
         years=args.years,
         payments_per_year=args.payments_per_year,
     )
-    summary = calculator.summary()
-
     if args.json:
-        payload: Dict[str, Any] = {"summary": summary}
+        payload: Dict[str, Any] = {"summary": calculator.summary()}
         if args.schedule > 0:
-            schedule = calculator.amortization_schedule(limit=args.schedule)
-            payload["schedule"] = [row.as_dict() for row in schedule]
-        print(json.dumps(payload, indent=2))
+            payload["schedule"] = calculator.schedule_as_dicts(limit=args.schedule)
+        if orjson is not None:
+            sys.stdout.buffer.write(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
+            sys.stdout.buffer.write(b"\n")
+        else:
+            print(json.dumps(payload, indent=2))
         return
 
-    print(format_summary(summary))
+    print(format_summary(calculator))
     if args.schedule > 0:
-        print("\nAmortization Schedule:")
-        cols = ("#".ljust(4), "Interest".rjust(12), "Principal".rjust(12), "Balance".rjust(14))
-        print("".join(cols))
-        print("-" * 44)
-        for row in calculator.amortization_schedule(limit=args.schedule):
-            print(
-                f"{row.payment_number:<4}"
-                f"{row.interest:>12.2f}"
-                f"{row.principal:>12.2f}"
-                f"{row.balance:>14.2f}"
-            )
+        rows = [_ROW_TEMPLATE % row for row in calculator.schedule_as_rows(limit=args.schedule)]
+        sys.stdout.write(
+            "\n".join(["\nAmortization Schedule:", _HEADER, _SEP, *rows]) + "\n"
+        )
 
 
 if __name__ == "__main__":
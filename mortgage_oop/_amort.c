@@ -0,0 +1,77 @@
+/* C amortization kernel.
+ *
+ * Optional fast path for mortgage_oop._kernels. Build in place with
+ * `python setup.py build_ext --inplace`; the package falls back to the
+ * numba/NumPy kernels when this module is absent.
+ */
+
+#define PY_SSIZE_T_CLEAN
+#include <Python.h>
+
+#define NPY_NO_DEPRECATED_API NPY_1_7_API_VERSION
+#include <numpy/arrayobject.h>
+
+static PyObject *
+amort(PyObject *Py_UNUSED(self), PyObject *args)
+{
+    double principal, rate, payment;
+    Py_ssize_t periods;
+
+    if (!PyArg_ParseTuple(args, "dddn", &principal, &rate, &payment, &periods))
+        return NULL;
+    if (periods < 0) {
+        PyErr_SetString(PyExc_ValueError, "periods must be non-negative");
+        return NULL;
+    }
+
+    npy_intp dims[1] = {periods};
+    PyArrayObject *interest = (PyArrayObject *)PyArray_SimpleNew(1, dims, NPY_FLOAT64);
+    PyArrayObject *principal_paid = (PyArrayObject *)PyArray_SimpleNew(1, dims, NPY_FLOAT64);
+    PyArrayObject *balance = (PyArrayObject *)PyArray_SimpleNew(1, dims, NPY_FLOAT64);
+    if (interest == NULL || principal_paid == NULL || balance == NULL) {
+        Py_XDECREF(interest);
+        Py_XDECREF(principal_paid);
+        Py_XDECREF(balance);
+        return NULL;
+    }
+
+    double *i = (double *)PyArray_DATA(interest);
+    double *p = (double *)PyArray_DATA(principal_paid);
+    double *b = (double *)PyArray_DATA(balance);
+
+    double running = principal;
+    for (Py_ssize_t k = 0; k < periods; k++) {
+        double paid_interest = running * rate;
+        double paid_principal = payment - paid_interest;
+        running -= paid_principal;
+        i[k] = paid_interest;
+        p[k] = paid_principal;
+        b[k] = running;
+    }
+    /* Float drift can only push the final balance below zero. */
+    if (periods > 0 && b[periods - 1] < 0.0)
+        b[periods - 1] = 0.0;
+
+    return Py_BuildValue("(NNN)", interest, principal_paid, balance);
+}
+
+static PyMethodDef amort_methods[] = {
+    {"amort", amort, METH_VARARGS,
+     "amort(principal, rate, payment, periods) -> (interest, principal, balance)"},
+    {NULL, NULL, 0, NULL},
+};
+
+static struct PyModuleDef amort_module = {
+    PyModuleDef_HEAD_INIT,
+    "_amort",
+    "C amortization kernel for mortgage_oop.",
+    -1,
+    amort_methods,
+};
+
+PyMODINIT_FUNC
+PyInit__amort(void)
+{
+    import_array();
+    return PyModule_Create(&amort_module);
+}
@@ -0,0 +1,86 @@
+"""Numeric kernels for amortization schedules.
+
+All implementations return `(interest, principal, balance)` float64
+arrays of length `periods`. The fastest available one wins: the C
+extension (built via ``python setup.py build_ext --inplace``) has the
+lowest per-call overhead, then the numba-compiled recurrence, then the
+NumPy closed form, which is always available.
+"""
+
+from __future__ import annotations
+
+from typing import Tuple
+
+import numpy as np
+
+try:
+    from mortgage_oop._amort import amort as _amort_c
+except ImportError:  # pragma: no cover - the C extension is optional
+    _amort_c = None
+
+# Importing numba costs a noticeable chunk of startup time, so only pay
+# for it when the C kernel is not there to win the dispatch anyway.
+if _amort_c is None:
+    try:
+        from numba import njit
+    except ImportError:  # pragma: no cover - numba is optional
+        njit = None
+else:
+    njit = None
+
+
+def _amort_numpy(
+    principal: float, rate: float, payment: float, periods: int
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    if periods <= 0:
+        empty = np.empty(0, dtype=np.float64)
+        return empty, empty.copy(), empty.copy()
+    k = np.arange(1, periods + 1, dtype=np.float64)
+    if rate == 0:
+        balance = principal - payment * k
+    else:
+        growth = np.power(1.0 + rate, k)
+        balance = principal * growth - payment * (growth - 1.0) / rate
+    prior_balance = np.concatenate(([principal], balance[:-1]))
+    # Float drift can only push the final balance below zero; clamp it
+    # once instead of over the whole array.
+    if periods > 0 and balance[-1] < 0.0:
+        balance[-1] = 0.0
+    interest = prior_balance * rate
+    principal_paid = payment - interest
+    return interest, principal_paid, balance
+
+
+if njit is not None:
+
+    @njit(cache=True, fastmath=True)
+    def _amort_numba(
+        principal: float, rate: float, payment: float, periods: int
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        interest = np.empty(periods, dtype=np.float64)
+        principal_paid = np.empty(periods, dtype=np.float64)
+        balance = np.empty(periods, dtype=np.float64)
+        running = principal
+        for k in range(periods):
+            paid_interest = running * rate
+            paid_principal = payment - paid_interest
+            running = running - paid_principal
+            interest[k] = paid_interest
+            principal_paid[k] = paid_principal
+            balance[k] = running
+        # Float drift can only push the final balance below zero; clamp
+        # it once after the loop instead of on every iteration.
+        if periods > 0 and balance[periods - 1] < 0.0:
+            balance[periods - 1] = 0.0
+        return interest, principal_paid, balance
+
+    _amort_jit = _amort_numba
+else:
+    _amort_jit = None
+
+if _amort_c is not None:
+    amort = _amort_c
+elif _amort_jit is not None:
+    amort = _amort_jit
+else:
+    amort = _amort_numpy
@@ -2,31 +2,51 @@
 
 from __future__ import annotations
 
-import tkinter as tk
-from tkinter import messagebox, ttk
+from typing import TYPE_CHECKING
 
 from mortgage_oop.mortgage_calculator import MortgageCalculator
 
+if TYPE_CHECKING:
+    import tkinter as tk
+
 
 class MortgageGUI:
     """Simple Tkinter GUI wrapper around the MortgageCalculator."""
 
     def __init__(self, root: tk.Tk | None = None) -> None:
+        # tkinter is imported lazily so merely importing this module
+        # (e.g. for introspection or tests) does not pay Tk startup cost.
+        import tkinter as tk
+        from tkinter import messagebox, ttk
+
+        self._tk = tk
+        self._ttk = ttk
+        self._messagebox = messagebox
         self.root = root or tk.Tk()
         self.root.title("Mortgage OOP Calculator")
+        self._last_inputs: tuple | None = None
+        self._last_calc: MortgageCalculator | None = None
         self._init_vars()
         self._build_layout()
 
     def _init_vars(self) -> None:
-        self.principal_var = tk.StringVar(value="300000")
-        self.rate_var = tk.StringVar(value="3.5")
-        self.years_var = tk.StringVar(value="30")
-        self.ppy_var = tk.StringVar(value="12")
-        self.schedule_rows_var = tk.StringVar(value="12")
-        self.summary_var = tk.StringVar(value="")
+        self.principal_var = self._tk.StringVar(value="300000")
+        self.rate_var = self._tk.StringVar(value="3.5")
+        self.years_var = self._tk.StringVar(value="30")
+        self.ppy_var = self._tk.StringVar(value="12")
+        self.schedule_rows_var = self._tk.StringVar(value="12")
+        self.summary_var = self._tk.StringVar(value="")
+        for var in (
+            self.principal_var,
+            self.rate_var,
+            self.years_var,
+            self.ppy_var,
+            self.schedule_rows_var,
+        ):
+            var.trace_add("write", self._on_input_changed)
 
     def _build_layout(self) -> None:
-        container = ttk.Frame(self.root, padding="12 12 12 12")
+        container = self._ttk.Frame(self.root, padding="12 12 12 12")
         container.grid(column=0, row=0, sticky="NSEW")
         self.root.columnconfigure(0, weight=1)
         self.root.rowconfigure(0, weight=1)
@@ -39,15 +59,20 @@ class MortgageGUI:
             ("Schedule rows", self.schedule_rows_var),
         ]
         for idx, (label, var) in enumerate(fields):
-            ttk.Label(container, text=label).grid(column=0, row=idx, sticky="W", pady=2)
-            ttk.Entry(container, textvariable=var, width=25).grid(
+            self._ttk.Label(container, text=label).grid(column=0, row=idx, sticky="W", pady=2)
+            self._ttk.Entry(container, textvariable=var, width=25).grid(
                 column=1,
                 row=idx,
                 sticky="EW",
                 pady=2,
             )
 
-        ttk.Button(container, text="Calculate", command=self._on_calculate).grid(
+        self.calculate_button = self._ttk.Button(
+            container,
+            text="Calculate",
+            command=self._on_calculate,
+        )
+        self.calculate_button.grid(
             column=0,
             row=len(fields),
             columnspan=2,
@@ -55,15 +80,19 @@ class MortgageGUI:
             sticky="EW",
         )
 
-        summary_frame = ttk.LabelFrame(container, text="Summary", padding="8 8 8 8")
+        summary_frame = self._ttk.LabelFrame(container, text="Summary", padding="8 8 8 8")
         summary_frame.grid(column=0, row=len(fields) + 1, columnspan=2, sticky="NSEW")
-        ttk.Label(summary_frame, textvariable=self.summary_var, justify="left").grid(
+        self._ttk.Label(summary_frame, textvariable=self.summary_var, justify="left").grid(
             column=0,
             row=0,
             sticky="W",
         )
 
-        schedule_frame = ttk.LabelFrame(container, text="Amortization (preview)", padding="8 8 8 8")
+        schedule_frame = self._ttk.LabelFrame(
+            container,
+            text="Amortization (preview)",
+            padding="8 8 8 8",
+        )
         schedule_frame.grid(
             column=0,
             row=len(fields) + 2,
@@ -73,7 +102,7 @@ class MortgageGUI:
         )
 
         columns = ("#", "Interest", "Principal", "Balance")
-        self.schedule_tree = ttk.Treeview(
+        self.schedule_tree = self._ttk.Treeview(
             schedule_frame,
             columns=columns,
             show="headings",
@@ -85,7 +114,7 @@ class MortgageGUI:
             width = 60 if col == "#" else 110
             self.schedule_tree.column(col, anchor=anchor, width=width, stretch=False)
         self.schedule_tree.grid(column=0, row=0, sticky="NSEW")
-        scrollbar = ttk.Scrollbar(
+        scrollbar = self._ttk.Scrollbar(
             schedule_frame,
             orient="vertical",
             command=self.schedule_tree.yview,
@@ -134,51 +163,61 @@ class MortgageGUI:
                 positive=True,
             )
         except ValueError as exc:
-            messagebox.showerror("Validation error", str(exc), parent=self.root)
+            self._messagebox.showerror("Validation error", str(exc), parent=self.root)
             return
 
-        try:
-            calculator = MortgageCalculator(
-                principal=principal,
-                annual_rate=rate,
-                years=years,
-                payments_per_year=payments_per_year,
-            )
-        except ValueError as exc:
-            messagebox.showerror("Mortgage error", str(exc), parent=self.root)
+        loan_inputs = (principal, rate, years, payments_per_year)
+        if self._last_inputs == (loan_inputs, schedule_rows):
             return
 
+        if self._last_calc is not None and self._last_inputs is not None and (
+            loan_inputs == self._last_inputs[0]
+        ):
+            # Only the schedule row count changed; reuse the cached
+            # calculator and its memoized derived values.
+            calculator = self._last_calc
+        else:
+            try:
+                calculator = MortgageCalculator(
+                    principal=principal,
+                    annual_rate=rate,
+                    years=years,
+                    payments_per_year=payments_per_year,
+                )
+            except ValueError as exc:
+                self._messagebox.showerror("Mortgage error", str(exc), parent=self.root)
+                return
+
         self._update_summary(calculator)
         self._populate_schedule(calculator, schedule_rows)
+        self._last_inputs = (loan_inputs, schedule_rows)
+        self._last_calc = calculator
+        self.calculate_button.state(["disabled"])
+
+    def _on_input_changed(self, *_args: object) -> None:
+        """Re-arm the Calculate button once any input field is edited."""
+        self.calculate_button.state(["!disabled"])
 
     def _update_summary(self, calculator: MortgageCalculator) -> None:
-        summary = calculator.summary()
-        summary_lines = [
-            f"Principal:      {summary['principal']}",
-            f"Annual rate:    {summary['annual_rate']}%",
-            f"Term (years):   {summary['years']}",
-            f"Payments/Year:  {summary['payments_per_year']}",
-            f"Payment amount: {summary['payment_amount']}",
-            f"Total cost:     {summary['total_cost']}",
-            f"Total interest: {summary['total_interest']}",
-        ]
-        self.summary_var.set("\n".join(summary_lines))
+        self.summary_var.set(calculator.summary_text)
 
     def _populate_schedule(self, calculator: MortgageCalculator, rows: int) -> None:
-        for item in self.schedule_tree.get_children():
-            self.schedule_tree.delete(item)
-        schedule = calculator.amortization_schedule(limit=rows)
-        for entry in schedule:
-            self.schedule_tree.insert(
-                "",
-                "end",
-                values=(
-                    entry.payment_number,
-                    f"{entry.interest:.2f}",
-                    f"{entry.principal:.2f}",
-                    f"{entry.balance:.2f}",
-                ),
-            )
+        tree = self.schedule_tree
+        children = tree.get_children()
+        if children:
+            tree.delete(*children)
+        values = [
+            (number, f"{interest:.2f}", f"{principal:.2f}", f"{balance:.2f}")
+            for number, interest, principal, balance in calculator.schedule_as_rows(limit=rows)
+        ]
+        # Hide the columns while inserting so Tk does not re-layout the
+        # widget once per row, then restore them and flush in one pass.
+        tree.configure(displaycolumns=())
+        insert = tree.insert
+        for row_values in values:
+            insert("", "end", values=row_values)
+        tree.configure(displaycolumns="#all")
+        self.root.update_idletasks()
 
     def run(self) -> None:
         """Start the Tkinter main loop."""
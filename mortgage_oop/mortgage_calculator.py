@@ -2,12 +2,15 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Dict, List
+import math
+from typing import Dict, Iterator, List, NamedTuple, Optional, Tuple
 
+import numpy as np
 
-@dataclass(frozen=True)
-class PaymentBreakdown:
+from mortgage_oop import _kernels
+
+
+class PaymentBreakdown(NamedTuple):
     """Represents a single amortization payment."""
 
     payment_number: int
@@ -18,15 +21,27 @@ class PaymentBreakdown:
     def as_dict(self) -> Dict[str, float]:
         return {
             "payment_number": self.payment_number,
-            "interest": round(self.interest, 2),
-            "principal": round(self.principal, 2),
-            "balance": round(self.balance, 2),
+            "interest": self.interest,
+            "principal": self.principal,
+            "balance": self.balance,
         }
 
 
 class MortgageCalculator:
     """Encapsulates mortgage computations."""
 
+    __slots__ = (
+        "principal",
+        "annual_rate",
+        "years",
+        "payments_per_year",
+        "periodic_rate",
+        "total_payments",
+        "_payment_cache",
+        "_summary_cache",
+        "_summary_text_cache",
+    )
+
     def __init__(
         self,
         principal: float,
@@ -39,6 +54,11 @@ class MortgageCalculator:
         self.years = int(years)
         self.payments_per_year = int(payments_per_year)
         self._validate()
+        self.periodic_rate = (self.annual_rate / 100.0) / self.payments_per_year
+        self.total_payments = self.years * self.payments_per_year
+        self._payment_cache: Optional[float] = None
+        self._summary_cache: Optional[Dict[str, float]] = None
+        self._summary_text_cache: Optional[str] = None
 
     def _validate(self) -> None:
         if self.principal <= 0:
@@ -50,22 +70,49 @@ class MortgageCalculator:
         if self.payments_per_year <= 0:
             raise ValueError("Payments per year must be greater than zero.")
 
-    @property
-    def periodic_rate(self) -> float:
-        return (self.annual_rate / 100.0) / self.payments_per_year
-
-    @property
-    def total_payments(self) -> int:
-        return self.years * self.payments_per_year
+    # The calculator is effectively immutable after __init__. Cheap derived
+    # quantities are precomputed there; the rest are cached lazily in slots
+    # (functools.cached_property needs a __dict__, which __slots__ removes).
 
     def payment_amount(self) -> float:
-        rate = self.periodic_rate
-        n = self.total_payments
-        if rate == 0:
-            return self.principal / n
-        numerator = rate * self.principal
-        denominator = 1 - (1 + rate) ** -n
-        return numerator / denominator
+        cached = self._payment_cache
+        if cached is None:
+            rate = self.periodic_rate
+            n = self.total_payments
+            if rate == 0:
+                cached = self.principal / n
+            else:
+                # expm1/log1p keep full precision for small rates, where
+                # `1 - (1 + rate) ** -n` cancels catastrophically.
+                denominator = -math.expm1(-n * math.log1p(rate))
+                cached = (rate * self.principal) / denominator
+            self._payment_cache = cached
+        return cached
+
+    @staticmethod
+    def payment_amounts(
+        principal: np.ndarray | float,
+        annual_rate: np.ndarray | float,
+        years: np.ndarray | int,
+        payments_per_year: np.ndarray | int = 12,
+    ) -> np.ndarray:
+        """Vectorized `payment_amount` over broadcastable input grids.
+
+        Evaluates the payment formula for whole arrays at once (rate
+        shopping, principal sensitivity sweeps) instead of building one
+        calculator per grid point.
+        """
+        principal, annual_rate, years, payments_per_year = np.broadcast_arrays(
+            np.asarray(principal, dtype=np.float64),
+            np.asarray(annual_rate, dtype=np.float64),
+            np.asarray(years, dtype=np.float64),
+            np.asarray(payments_per_year, dtype=np.float64),
+        )
+        rate = (annual_rate / 100.0) / payments_per_year
+        n = years * payments_per_year
+        with np.errstate(divide="ignore", invalid="ignore"):
+            denominator = -np.expm1(-n * np.log1p(rate))
+            return np.where(rate == 0, principal / n, principal * rate / denominator)
 
     def total_cost(self) -> float:
         return self.payment_amount() * self.total_payments
@@ -73,37 +120,147 @@ class MortgageCalculator:
     def total_interest(self) -> float:
         return self.total_cost() - self.principal
 
-    def amortization_schedule(self, limit: int | None = None) -> List[PaymentBreakdown]:
-        """Return amortization rows up to `limit` (defaults to full schedule)."""
+    def balance_after(self, k: int) -> float:
+        """Return the remaining balance after payment `k` in O(1).
+
+        Uses the closed form `B_k = P*(1+r)^k - M*((1+r)^k - 1)/r`
+        instead of simulating k payments.
+        """
+        if k < 0 or k > self.total_payments:
+            raise ValueError("Payment number must be between 0 and total_payments.")
+        rate = self.periodic_rate
+        if rate == 0:
+            return max(self.principal - self.payment_amount() * k, 0.0)
+        growth = math.pow(1.0 + rate, k)
+        balance = self.principal * growth - self.payment_amount() * (growth - 1.0) / rate
+        return max(balance, 0.0)
+
+    def interest_at(self, k: int) -> float:
+        """Return the interest portion of payment `k` in O(1)."""
+        if k < 1:
+            raise ValueError("Payment number must be at least 1.")
+        return self.balance_after(k - 1) * self.periodic_rate
+
+    def principal_at(self, k: int) -> float:
+        """Return the principal portion of payment `k` in O(1)."""
+        return self.payment_amount() - self.interest_at(k)
+
+    def amortization_schedule_arrays(
+        self, limit: int | None = None
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Return the schedule as `(interest, principal, balance)` float64 arrays.
+
+        The schedule is computed by the fastest available kernel in
+        `mortgage_oop._kernels` (a numba-compiled recurrence when numba is
+        installed, the NumPy closed form otherwise).
+        """
         payment = self.payment_amount()
-        balance = self.principal
         rate = self.periodic_rate
-        schedule: List[PaymentBreakdown] = []
-        max_rows = self.total_payments if limit is None else min(limit, self.total_payments)
-        for number in range(1, max_rows + 1):
-            interest = balance * rate
-            principal_paid = payment - interest
-            balance = max(balance - principal_paid, 0.0)
-            schedule.append(
-                PaymentBreakdown(
-                    payment_number=number,
-                    interest=interest,
-                    principal=principal_paid,
-                    balance=balance,
-                )
+        if limit is None:
+            rows = self.total_payments
+        else:
+            # A non-positive limit yields empty arrays, matching the
+            # empty list the row-based methods have always returned.
+            rows = max(0, min(limit, self.total_payments))
+        return _kernels.amort(self.principal, rate, payment, rows)
+
+    def iter_schedule(self, limit: int | None = None) -> Iterator[PaymentBreakdown]:
+        """Yield amortization rows lazily up to `limit` (defaults to full schedule)."""
+        interest, principal, balance = self.amortization_schedule_arrays(limit)
+        for number, row in enumerate(
+            zip(interest.tolist(), principal.tolist(), balance.tolist()),
+            start=1,
+        ):
+            yield PaymentBreakdown(
+                payment_number=number,
+                interest=row[0],
+                principal=row[1],
+                balance=row[2],
+            )
+            if row[2] <= 0:
+                break
+
+    def amortization_schedule(self, limit: int | None = None) -> List[PaymentBreakdown]:
+        """Return amortization rows up to `limit` (defaults to full schedule)."""
+        return list(self.iter_schedule(limit))
+
+    def schedule_as_dicts(self, limit: int | None = None) -> List[Dict[str, float]]:
+        """Return schedule rows as plain dicts, ready for JSON serialization.
+
+        Skips the PaymentBreakdown layer entirely, so callers that only
+        need the dict shape (the CLI JSON path) avoid one allocation per
+        row.
+        """
+        interest, principal, balance = self.amortization_schedule_arrays(limit)
+        rows: List[Dict[str, float]] = []
+        for number, (paid_interest, paid_principal, remaining) in enumerate(
+            zip(interest.tolist(), principal.tolist(), balance.tolist()),
+            start=1,
+        ):
+            rows.append(
+                {
+                    "payment_number": number,
+                    "interest": paid_interest,
+                    "principal": paid_principal,
+                    "balance": remaining,
+                }
             )
-            if balance <= 0:
+            if remaining <= 0:
                 break
-        return schedule
+        return rows
+
+    def schedule_as_rows(self, limit: int | None = None) -> List[Tuple[int, float, float, float]]:
+        """Return `(payment_number, interest, principal, balance)` tuples.
+
+        Lighter-weight companion to `schedule_as_dicts` for tabular
+        consumers such as the GUI Treeview.
+        """
+        interest, principal, balance = self.amortization_schedule_arrays(limit)
+        rows: List[Tuple[int, float, float, float]] = []
+        for number, row in enumerate(
+            zip(interest.tolist(), principal.tolist(), balance.tolist()),
+            start=1,
+        ):
+            rows.append((number, *row))
+            if row[2] <= 0:
+                break
+        return rows
+
+    @property
+    def _summary(self) -> Dict[str, float]:
+        cached = self._summary_cache
+        if cached is None:
+            cached = self._summary_cache = {
+                "principal": self.principal,
+                "annual_rate": self.annual_rate,
+                "years": self.years,
+                "payments_per_year": self.payments_per_year,
+                "payment_amount": self.payment_amount(),
+                "total_cost": self.total_cost(),
+                "total_interest": self.total_interest(),
+            }
+        return cached
 
     def summary(self) -> Dict[str, float]:
         """Provide a formatted summary of the mortgage."""
-        return {
-            "principal": round(self.principal, 2),
-            "annual_rate": round(self.annual_rate, 4),
-            "years": self.years,
-            "payments_per_year": self.payments_per_year,
-            "payment_amount": round(self.payment_amount(), 2),
-            "total_cost": round(self.total_cost(), 2),
-            "total_interest": round(self.total_interest(), 2),
-        }
+        # Shallow copy so callers cannot mutate the cached dict.
+        return dict(self._summary)
+
+    @property
+    def summary_text(self) -> str:
+        """Human-readable summary block, formatted once per instance."""
+        cached = self._summary_text_cache
+        if cached is not None:
+            return cached
+        summary = self._summary
+        lines = [
+            f"Principal:        {summary['principal']:.2f}",
+            f"Annual Rate (%):  {summary['annual_rate']}",
+            f"Years:            {summary['years']}",
+            f"Payments/Year:    {summary['payments_per_year']}",
+            f"Payment Amount:   {summary['payment_amount']:.2f}",
+            f"Total Cost:       {summary['total_cost']:.2f}",
+            f"Total Interest:   {summary['total_interest']:.2f}",
+        ]
+        text = self._summary_text_cache = "\n".join(lines)
+        return text
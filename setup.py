@@ -0,0 +1,22 @@
+"""Build script for the optional C amortization kernel.
+
+Run `python setup.py build_ext --inplace` to compile
+`mortgage_oop._amort`; everything works without it via the numba/NumPy
+fallbacks in `mortgage_oop._kernels`.
+"""
+
+import numpy as np
+from setuptools import Extension, setup
+
+setup(
+    name="mortgage-oop",
+    packages=["mortgage_oop"],
+    ext_modules=[
+        Extension(
+            "mortgage_oop._amort",
+            sources=["mortgage_oop/_amort.c"],
+            include_dirs=[np.get_include()],
+            extra_compile_args=["-O3"],
+        )
+    ],
+)
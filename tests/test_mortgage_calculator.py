@@ -16,6 +16,66 @@ def test_total_interest_zero_rate_matches_principal_difference():
     assert math.isclose(calc.total_interest(), 0.0, abs_tol=1e-6)
 
 
+def test_amortization_schedule_arrays_match_recurrence():
+    calc = MortgageCalculator(principal=300_000, annual_rate=3.5, years=30)
+    interest, principal, balance = calc.amortization_schedule_arrays()
+    assert len(interest) == calc.total_payments
+    payment = calc.payment_amount()
+    rate = calc.periodic_rate
+    running = calc.principal
+    for index in range(calc.total_payments):
+        expected_interest = running * rate
+        expected_principal = payment - expected_interest
+        running = max(running - expected_principal, 0.0)
+        assert math.isclose(interest[index], expected_interest, abs_tol=1e-6)
+        assert math.isclose(principal[index], expected_principal, abs_tol=1e-6)
+        assert math.isclose(balance[index], running, abs_tol=1e-5)
+    assert math.isclose(balance[-1], 0.0, abs_tol=1e-5)
+
+
+def test_iter_schedule_is_lazy_and_matches_list_form():
+    calc = MortgageCalculator(principal=200_000, annual_rate=4.0, years=20)
+    iterator = calc.iter_schedule(limit=6)
+    assert iter(iterator) is iterator
+    assert list(iterator) == calc.amortization_schedule(limit=6)
+
+
+def test_schedule_as_dicts_matches_dataclass_rows():
+    calc = MortgageCalculator(principal=200_000, annual_rate=4.0, years=20)
+    dicts = calc.schedule_as_dicts(limit=5)
+    rows = calc.amortization_schedule(limit=5)
+    assert dicts == [row.as_dict() for row in rows]
+
+
+def test_closed_form_point_queries_match_schedule():
+    calc = MortgageCalculator(principal=300_000, annual_rate=3.5, years=30)
+    schedule = calc.amortization_schedule()
+    n = calc.total_payments
+    for k in (1, n // 2, n):
+        row = schedule[k - 1]
+        assert math.isclose(calc.balance_after(k), row.balance, abs_tol=1e-5)
+        assert math.isclose(calc.interest_at(k), row.interest, abs_tol=1e-6)
+        assert math.isclose(calc.principal_at(k), row.principal, abs_tol=1e-6)
+    assert calc.balance_after(0) == calc.principal
+    with pytest.raises(ValueError):
+        calc.balance_after(n + 1)
+
+
+def test_payment_amounts_matches_scalar_calculators():
+    rates = [0.0, 1.25, 3.5, 7.0]
+    batch = MortgageCalculator.payment_amounts(300_000, rates, 30)
+    for rate, amount in zip(rates, batch):
+        calc = MortgageCalculator(principal=300_000, annual_rate=rate, years=30)
+        assert math.isclose(amount, calc.payment_amount(), rel_tol=1e-12)
+
+
+def test_non_positive_schedule_limit_yields_empty_schedule():
+    calc = MortgageCalculator(principal=100_000, annual_rate=5.0, years=10)
+    assert calc.amortization_schedule(limit=0) == []
+    assert calc.amortization_schedule(limit=-1) == []
+    assert calc.schedule_as_dicts(limit=-1) == []
+
+
 def test_invalid_inputs_raise_value_error():
     with pytest.raises(ValueError):
         MortgageCalculator(principal=-10, annual_rate=5, years=10)